@@ -8,7 +8,8 @@ import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+from homeassistant.helpers.typing import ConfigType
 
 from .const import (
     ATTR_DEVICE_ID,
@@ -23,29 +24,77 @@ from .coordinator import NetworkMonitorCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
 SERVICE_FULL_SCAN_SCHEMA = vol.Schema({})
 SERVICE_FORGET_DEVICE_SCHEMA = vol.Schema(
-    {vol.Required(ATTR_DEVICE_ID): str}
+    {vol.Required(ATTR_DEVICE_ID): cv.string}
 )
 SERVICE_WATCH_DEVICE_SCHEMA = vol.Schema(
     {
-        vol.Required(ATTR_DEVICE_ID): str,
-        vol.Required(ATTR_WATCHED): bool,
+        vol.Required(ATTR_DEVICE_ID): cv.string,
+        vol.Required(ATTR_WATCHED): cv.boolean,
     }
 )
 
 
 def _get_coordinators(hass: HomeAssistant) -> list[NetworkMonitorCoordinator]:
     """Get all active coordinators."""
-    coordinators: list[NetworkMonitorCoordinator] = []
-    for entry in hass.config_entries.async_entries(DOMAIN):
-        try:
-            coord = entry.runtime_data
-        except (AttributeError, RuntimeError):
-            continue
-        if isinstance(coord, NetworkMonitorCoordinator):
-            coordinators.append(coord)
-    return coordinators
+    return list(hass.data[DOMAIN]["coordinators"])
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Network Monitor component and register its services."""
+    hass.data[DOMAIN] = {"coordinators": set()}
+
+    async def handle_full_scan(call: ServiceCall) -> None:
+        """Handle full_scan service call."""
+        for coord in _get_coordinators(hass):
+            await coord.async_trigger_full_scan()
+
+    async def handle_forget_device(call: ServiceCall) -> None:
+        """Handle forget_device service call."""
+        device_id = call.data[ATTR_DEVICE_ID]
+        for coord in _get_coordinators(hass):
+            resolved = coord.resolve_device_id(device_id)
+            if resolved and await coord.async_forget_device(resolved):
+                return
+        _LOGGER.warning(
+            "forget_device: device_id '%s' not found in any instance", device_id
+        )
+
+    async def handle_watch_device(call: ServiceCall) -> None:
+        """Handle watch_device service call."""
+        device_id = call.data[ATTR_DEVICE_ID]
+        watched = call.data[ATTR_WATCHED]
+        for coord in _get_coordinators(hass):
+            resolved = coord.resolve_device_id(device_id)
+            if resolved and await coord.async_watch_device(
+                resolved, watched=watched
+            ):
+                return
+        _LOGGER.warning(
+            "watch_device: device_id '%s' not found in any instance",
+            device_id,
+        )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_FULL_SCAN, handle_full_scan, SERVICE_FULL_SCAN_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_FORGET_DEVICE,
+        handle_forget_device,
+        SERVICE_FORGET_DEVICE_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_WATCH_DEVICE,
+        handle_watch_device,
+        SERVICE_WATCH_DEVICE_SCHEMA,
+    )
+
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -67,6 +116,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Store coordinator in runtime data
     entry.runtime_data = coordinator
+    hass.data[DOMAIN]["coordinators"].add(coordinator)
 
     # Register the integration device
     device_registry = dr.async_get(hass)
@@ -84,56 +134,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Register update listener for options changes
     entry.async_on_unload(entry.add_update_listener(async_update_options))
 
-    # Register services (only once per domain)
-    if not hass.services.has_service(DOMAIN, SERVICE_FULL_SCAN):
-
-        async def handle_full_scan(call: ServiceCall) -> None:
-            """Handle full_scan service call."""
-            for coord in _get_coordinators(hass):
-                await coord.async_trigger_full_scan()
-
-        async def handle_forget_device(call: ServiceCall) -> None:
-            """Handle forget_device service call."""
-            device_id = call.data[ATTR_DEVICE_ID]
-            for coord in _get_coordinators(hass):
-                resolved = coord.resolve_device_id(device_id)
-                if resolved and await coord.async_forget_device(resolved):
-                    return
-            _LOGGER.warning(
-                "forget_device: device_id '%s' not found in any instance", device_id
-            )
-
-        async def handle_watch_device(call: ServiceCall) -> None:
-            """Handle watch_device service call."""
-            device_id = call.data[ATTR_DEVICE_ID]
-            watched = call.data[ATTR_WATCHED]
-            for coord in _get_coordinators(hass):
-                resolved = coord.resolve_device_id(device_id)
-                if resolved and await coord.async_watch_device(
-                    resolved, watched=watched
-                ):
-                    return
-            _LOGGER.warning(
-                "watch_device: device_id '%s' not found in any instance",
-                device_id,
-            )
-
-        hass.services.async_register(
-            DOMAIN, SERVICE_FULL_SCAN, handle_full_scan, SERVICE_FULL_SCAN_SCHEMA
-        )
-        hass.services.async_register(
-            DOMAIN,
-            SERVICE_FORGET_DEVICE,
-            handle_forget_device,
-            SERVICE_FORGET_DEVICE_SCHEMA,
-        )
-        hass.services.async_register(
-            DOMAIN,
-            SERVICE_WATCH_DEVICE,
-            handle_watch_device,
-            SERVICE_WATCH_DEVICE_SCHEMA,
-        )
-
     return True
 
 
@@ -141,17 +141,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
-    # Remove services if this is the last config entry
     if unload_ok:
-        remaining = [
-            e
-            for e in hass.config_entries.async_entries(DOMAIN)
-            if e.entry_id != entry.entry_id
-        ]
-        if not remaining:
-            hass.services.async_remove(DOMAIN, SERVICE_FULL_SCAN)
-            hass.services.async_remove(DOMAIN, SERVICE_FORGET_DEVICE)
-            hass.services.async_remove(DOMAIN, SERVICE_WATCH_DEVICE)
+        coordinator: NetworkMonitorCoordinator = entry.runtime_data
+        # The coordinator's async_shutdown (registered by HA for this entry)
+        # flushes its devices and stops further saves
+        hass.data[DOMAIN]["coordinators"].discard(coordinator)
 
     return unload_ok
 
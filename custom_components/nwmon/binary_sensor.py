@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from typing import Any
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -10,6 +11,7 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -24,12 +26,30 @@ from .const import (
     ATTR_VENDOR,
     ATTR_WATCHED,
     DOMAIN,
+    NEW_DEVICE_COOLDOWN,
 )
 from .coordinator import NetworkMonitorCoordinator
 from .scanner import DeviceInfo
 
 _LOGGER = logging.getLogger(__name__)
 
+# Key skeleton for extra_state_attributes, copied and filled on each read
+_ATTRS_TEMPLATE: dict[str, Any] = dict.fromkeys(
+    (
+        ATTR_IP_ADDRESS,
+        ATTR_MAC_ADDRESS,
+        ATTR_HOSTNAME,
+        ATTR_VENDOR,
+        ATTR_FIRST_SEEN,
+        ATTR_LAST_SEEN,
+        ATTR_FAILED_CHECKS,
+        ATTR_LATENCY,
+        ATTR_WATCHED,
+    )
+)
+
+_MODEL = "Network Device"
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -40,38 +60,60 @@ async def async_setup_entry(
     coordinator = entry.runtime_data
 
     # Track which entities we've created
-    known_entities: set[str] = set()
+    known_entities: set[str] = set(coordinator.devices)
+    pending = coordinator.async_track_new_devices()
+    # Shared by all device entries of this config entry
+    via_device = (DOMAIN, entry.entry_id)
 
     @callback
     def async_add_new_devices() -> None:
         """Add entities for newly discovered devices."""
         new_entities: list[DeviceBinarySensor] = []
 
-        _LOGGER.debug(
-            "async_add_new_devices called: %d devices in coordinator, %d known entities, last_update_success=%s",
-            len(coordinator.devices),
-            len(known_entities),
-            coordinator.last_update_success,
-        )
-
-        for device in coordinator.devices.values():
-            if device.identifier not in known_entities:
-                _LOGGER.debug("Creating entity for device: %s (%s)", device.identifier, device.display_name)
-                known_entities.add(device.identifier)
-                new_entities.append(
-                    DeviceBinarySensor(coordinator, entry.entry_id, device)
-                )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "async_add_new_devices called: %d pending devices, %d known entities, last_update_success=%s",
+                len(pending),
+                len(known_entities),
+                coordinator.last_update_success,
+            )
+
+        while pending:
+            identifier = pending.pop()
+            if identifier in known_entities:
+                continue
+            if (device := coordinator.async_get_device(identifier)) is None:
+                continue
+            known_entities.add(identifier)
+            new_entities.append(
+                DeviceBinarySensor(coordinator, via_device, device)
+            )
 
         if new_entities:
             _LOGGER.info("Adding %d new device entities", len(new_entities))
             async_add_entities(new_entities)
 
     # Add initial devices
-    async_add_new_devices()
+    if coordinator.devices:
+        async_add_entities(
+            [
+                DeviceBinarySensor(coordinator, via_device, device)
+                for device in coordinator.devices.values()
+            ]
+        )
 
-    # Listen for coordinator updates to add new devices
+    # Listen for coordinator updates to add new devices, batching additions
+    # that arrive in quick succession into one async_add_entities call
+    add_debouncer = Debouncer(
+        hass,
+        _LOGGER,
+        cooldown=NEW_DEVICE_COOLDOWN,
+        immediate=True,
+        function=async_add_new_devices,
+    )
+    entry.async_on_unload(add_debouncer.async_shutdown)
     entry.async_on_unload(
-        coordinator.async_add_listener(async_add_new_devices)
+        coordinator.async_add_listener(add_debouncer.async_schedule_call)
     )
 
 
@@ -82,46 +124,43 @@ class DeviceBinarySensor(
 
     _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
     _attr_has_entity_name = True
+    _attr_name = "Connectivity"
 
     def __init__(
         self,
         coordinator: NetworkMonitorCoordinator,
-        entry_id: str,
+        via_device: tuple[str, str],
         device: DeviceInfo,
     ) -> None:
         """Initialize the binary sensor."""
         super().__init__(coordinator)
         self._device_identifier = device.identifier
-        self._entry_id = entry_id
+        self._cached_device: DeviceInfo | None = device
+        self._attr_available = coordinator.last_update_success
 
         # Entity attributes
         self._attr_unique_id = f"{DOMAIN}_{device.identifier.replace(':', '')}"
-        self._attr_name = "Connectivity"
-
-    @property
-    def device_info(self) -> dict | None:
-        """Return device info."""
-        device = self.coordinator.async_get_device(self._device_identifier)
-        info = {
-            "identifiers": {(DOMAIN, f"device_{self._device_identifier}")},
-            "name": device.display_name if device else self._device_identifier,
-            "manufacturer": device.vendor if device else None,
-            "model": "Network Device",
-            "via_device": (DOMAIN, self._entry_id),
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, f"device_{device.identifier}")},
+            "name": device.display_name,
+            "manufacturer": device.vendor,
+            "model": _MODEL,
+            "via_device": via_device,
         }
-        if device and device.mac_address:
-            info["connections"] = {("mac", device.mac_address)}
-        return info
+        if device.mac_address:
+            self._attr_device_info["connections"] = {("mac", device.mac_address)}
 
     @property
     def _device(self) -> DeviceInfo | None:
-        """Get the current device data from coordinator."""
-        return self.coordinator.async_get_device(self._device_identifier)
+        """Get the device data captured at the last coordinator update."""
+        return self._cached_device
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self.coordinator.last_update_success and self._device is not None
+        # CoordinatorEntity.available would read the coordinator again; the
+        # value is precomputed in _handle_coordinator_update instead
+        return self._attr_available
 
     @property
     def is_on(self) -> bool | None:
@@ -131,24 +170,30 @@ class DeviceBinarySensor(
         return None
 
     @property
-    def extra_state_attributes(self) -> dict[str, str | None]:
+    def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
         if not (device := self._device):
             return {}
 
-        return {
-            ATTR_IP_ADDRESS: device.ip_address,
-            ATTR_MAC_ADDRESS: device.mac_address,
-            ATTR_HOSTNAME: device.hostname,
-            ATTR_VENDOR: device.vendor,
-            ATTR_FIRST_SEEN: device.first_seen.isoformat(),
-            ATTR_LAST_SEEN: device.last_seen.isoformat(),
-            ATTR_FAILED_CHECKS: device.failed_checks,
-            ATTR_LATENCY: device.last_latency_ms,
-            ATTR_WATCHED: device.watched,
-        }
+        attrs = _ATTRS_TEMPLATE.copy()
+        attrs[ATTR_IP_ADDRESS] = device.ip_address
+        attrs[ATTR_MAC_ADDRESS] = device.mac_address
+        attrs[ATTR_HOSTNAME] = device.hostname
+        attrs[ATTR_VENDOR] = device.vendor
+        attrs[ATTR_FIRST_SEEN] = device.first_seen_iso
+        attrs[ATTR_LAST_SEEN] = device.last_seen_iso
+        attrs[ATTR_FAILED_CHECKS] = device.failed_checks
+        attrs[ATTR_LATENCY] = device.last_latency_ms
+        attrs[ATTR_WATCHED] = device.watched
+        return attrs
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        self._cached_device = self.coordinator.async_get_device(
+            self._device_identifier
+        )
+        self._attr_available = (
+            self._cached_device is not None and self.coordinator.last_update_success
+        )
         super()._handle_coordinator_update()
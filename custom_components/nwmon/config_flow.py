@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import ipaddress
 import logging
+import re
 from typing import Any
 
 import voluptuous as vol
@@ -31,14 +32,50 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Cheap shape check run before the full ipaddress parser: an address made of
+# hex digits, colons and dots, optional IPv6 scope, optional prefix or netmask
+CIDR_REGEX = re.compile(r"^[0-9a-fA-F:.]+(?:%[^/\s]+)?(?:/[0-9.]+)?$")
+IPV4_CIDR_REGEX = re.compile(r"(\d{1,3})\.(\d{1,3})\.(\d{1,3})\.(\d{1,3})/(\d{1,2})")
+
+
+def _normalize_ipv4_cidr(line: str) -> str | None:
+    """Normalize a plain IPv4 CIDR without ipaddress.
+
+    Returns None for anything that needs the full parser (IPv6, netmasks,
+    leading zeros, out-of-range values) so it can raise the proper error.
+    """
+    if not (match := IPV4_CIDR_REGEX.fullmatch(line)):
+        return None
+    *octets, prefix = match.groups()
+    if any(len(octet) > 1 and octet[0] == "0" for octet in octets):
+        return None
+    a, b, c, d = (int(octet) for octet in octets)
+    prefixlen = int(prefix)
+    if prefixlen > 32 or a > 255 or b > 255 or c > 255 or d > 255:
+        return None
+    mask = (0xFFFFFFFF << (32 - prefixlen)) & 0xFFFFFFFF
+    network = ((a << 24) | (b << 16) | (c << 8) | d) & mask
+    return "%d.%d.%d.%d/%d" % (
+        network >> 24,
+        (network >> 16) & 0xFF,
+        (network >> 8) & 0xFF,
+        network & 0xFF,
+        prefixlen,
+    )
+
 
 def validate_networks(networks_str: str) -> list[str]:
     """Validate network ranges and return list of valid CIDRs."""
     networks = []
-    for line in networks_str.strip().split("\n"):
+    for line in networks_str.splitlines():
         line = line.strip()
         if not line:
             continue
+        if not CIDR_REGEX.match(line):
+            raise ValueError(f"Invalid network: {line}")
+        if (normalized := _normalize_ipv4_cidr(line)) is not None:
+            networks.append(normalized)
+            continue
         try:
             # Validate CIDR notation
             network = ipaddress.ip_network(line, strict=False)
@@ -1,5 +1,7 @@
 """Constants for the Network Monitor integration."""
 
+from homeassistant.const import Platform
+
 DOMAIN = "nwmon"
 
 # Configuration keys
@@ -18,7 +20,10 @@ DEFAULT_OFFLINE_THRESHOLD = 3  # failed checks before marking offline
 DEFAULT_PING_COUNT = 1  # pings per check
 
 # Platforms
-PLATFORMS = ["binary_sensor", "sensor"]
+PLATFORMS = [Platform.BINARY_SENSOR, Platform.SENSOR]
+
+# Seconds to coalesce new-device entity additions across coordinator updates
+NEW_DEVICE_COOLDOWN = 0.5
 
 # Attributes
 ATTR_IP_ADDRESS = "ip_address"
@@ -32,6 +37,7 @@ ATTR_FAILED_CHECKS = "failed_checks"
 # Storage
 STORAGE_VERSION = 1
 STORAGE_KEY = f"{DOMAIN}_devices"
+STORAGE_SAVE_DELAY = 30  # seconds to coalesce device state writes
 
 # New attributes
 ATTR_LATENCY = "latency_ms"
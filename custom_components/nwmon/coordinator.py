@@ -27,12 +27,18 @@ from .const import (
     EVENT_DEVICE_ONLINE,
     EVENT_WATCHED_DEVICE_OFFLINE,
     STORAGE_KEY,
+    STORAGE_SAVE_DELAY,
     STORAGE_VERSION,
 )
 from .scanner import DeviceInfo, NetworkScanner
 
 _LOGGER = logging.getLogger(__name__)
 
+# Separators ignored when matching user-provided MAC/IP device ids
+_NORMALIZE = str.maketrans("", "", ":-.")
+# Maps a device identifier onto its binary sensor entity id suffix
+_IDENT_CLEAN = str.maketrans({":": "", ".": "_"})
+
 
 class NetworkMonitorCoordinator(DataUpdateCoordinator[dict[str, DeviceInfo]]):
     """Coordinator for network monitoring with dual scan intervals."""
@@ -66,9 +72,19 @@ class NetworkMonitorCoordinator(DataUpdateCoordinator[dict[str, DeviceInfo]]):
 
         # Device tracking
         self._devices: dict[str, DeviceInfo] = {}
+        self._online_ids: set[str] = set()  # keys of devices with is_online set
+        self._event_entity_ids: dict[str, str] = {}  # device key -> event entity_id
+        # Service lookup indexes: normalized MAC / IP (raw and without dots) -> key
+        self._mac_index: dict[str, str] = {}
+        self._ip_index: dict[str, str] = {}
         self._last_full_scan: datetime | None = None
+        self._dirty = False  # Device state changed since the last scheduled save
+        self._shut_down = False  # Set once async_shutdown has run
         self._update_count = 0
+        self._scan_gen = 0  # Incremented per full scan to stamp found devices
         self._needs_initial_scan = True  # Always full scan on first update after startup
+        # Per-listener sets of identifiers added since the listener last looked
+        self._new_device_trackers: list[set[str]] = []
 
         # Calculate when to do full scans (every N quick checks)
         full_scan_minutes = self._full_scan_interval.total_seconds() / 60
@@ -90,7 +106,12 @@ class NetworkMonitorCoordinator(DataUpdateCoordinator[dict[str, DeviceInfo]]):
     @property
     def online_devices(self) -> list[DeviceInfo]:
         """Return online devices."""
-        return [d for d in self._devices.values() if d.is_online]
+        return [self._devices[identifier] for identifier in self._online_ids]
+
+    @property
+    def online_count(self) -> int:
+        """Return the number of online devices."""
+        return len(self._online_ids)
 
     @property
     def offline_devices(self) -> list[DeviceInfo]:
@@ -102,6 +123,53 @@ class NetworkMonitorCoordinator(DataUpdateCoordinator[dict[str, DeviceInfo]]):
         """Return timestamp of last full scan."""
         return self._last_full_scan
 
+    @callback
+    def async_track_new_devices(self) -> set[str]:
+        """Return a set collecting identifiers of devices added from now on.
+
+        Each caller gets its own set and is expected to pop identifiers
+        from it as it handles them.
+        """
+        pending: set[str] = set()
+        self._new_device_trackers.append(pending)
+        return pending
+
+    def _mark_new_device(self, identifier: str) -> None:
+        """Record a newly added device key for all trackers."""
+        for pending in self._new_device_trackers:
+            pending.add(identifier)
+
+    def _drop_device_key(self, identifier: str) -> None:
+        """Remove a no longer used device key from the per-key caches."""
+        self._online_ids.discard(identifier)
+        self._event_entity_ids.pop(identifier, None)
+        for pending in self._new_device_trackers:
+            pending.discard(identifier)
+
+    def _index_device(self, device: DeviceInfo) -> None:
+        """Add a device to the service lookup indexes."""
+        key = device.identifier
+        if device.mac_address:
+            self._mac_index[device.mac_address.lower().translate(_NORMALIZE)] = key
+        self._ip_index[device.ip_address] = key
+        self._ip_index[device.ip_address.translate(_NORMALIZE)] = key
+
+    def _unindex_device(self, device: DeviceInfo) -> None:
+        """Remove a device from the service lookup indexes."""
+        key = device.identifier
+        entries = [
+            (self._ip_index, device.ip_address),
+            (self._ip_index, device.ip_address.translate(_NORMALIZE)),
+        ]
+        if device.mac_address:
+            entries.append(
+                (self._mac_index, device.mac_address.lower().translate(_NORMALIZE))
+            )
+        for index, name in entries:
+            # Another device may have taken over this address since
+            if index.get(name) == key:
+                del index[name]
+
     async def async_load_devices(self) -> None:
         """Load devices from persistent storage."""
         _LOGGER.debug("Loading devices from storage")
@@ -112,7 +180,7 @@ class NetworkMonitorCoordinator(DataUpdateCoordinator[dict[str, DeviceInfo]]):
                 try:
                     device = DeviceInfo.from_dict(device_data)
                     self._devices[device.identifier] = device
-                except (KeyError, ValueError) as err:
+                except (KeyError, TypeError, ValueError) as err:
                     _LOGGER.warning("Failed to load device: %s", err)
 
             if "last_full_scan" in data and data["last_full_scan"]:
@@ -125,22 +193,31 @@ class NetworkMonitorCoordinator(DataUpdateCoordinator[dict[str, DeviceInfo]]):
                 except ValueError:
                     pass
 
+            self._online_ids = {
+                key for key, device in self._devices.items() if device.is_online
+            }
+            for device in self._devices.values():
+                self._index_device(device)
             _LOGGER.info("Loaded %d devices from storage", len(self._devices))
 
     def _build_event_data(self, device: DeviceInfo) -> dict[str, Any]:
         """Build event data dictionary for a device."""
-        identifier_clean = device.identifier.replace(":", "").replace(".", "_")
-        entity_id = f"binary_sensor.{DOMAIN}_{identifier_clean}"
+        identifier = device.identifier
+        if (entity_id := self._event_entity_ids.get(identifier)) is None:
+            identifier_clean = identifier.translate(_IDENT_CLEAN)
+            entity_id = self._event_entity_ids[identifier] = (
+                f"binary_sensor.{DOMAIN}_{identifier_clean}"
+            )
 
         return {
-            "device_id": device.identifier,
+            "device_id": identifier,
             "ip_address": device.ip_address,
             "mac_address": device.mac_address,
             "hostname": device.hostname,
             "vendor": device.vendor,
             "display_name": device.display_name,
-            "first_seen": device.first_seen.isoformat(),
-            "last_seen": device.last_seen.isoformat(),
+            "first_seen": device.first_seen_iso,
+            "last_seen": device.last_seen_iso,
             "entity_id": entity_id,
             "latency_ms": device.last_latency_ms,
             "watched": device.watched,
@@ -155,17 +232,42 @@ class NetworkMonitorCoordinator(DataUpdateCoordinator[dict[str, DeviceInfo]]):
         if device.watched and event_type == EVENT_DEVICE_OFFLINE:
             self.hass.bus.async_fire(EVENT_WATCHED_DEVICE_OFFLINE, event_data)
 
-    async def _async_save_devices(self) -> None:
-        """Save devices to persistent storage."""
-        # Deduplicate devices (same device may be stored under both IP and MAC keys)
-        unique_devices = {id(d): d for d in self._devices.values()}
-        data = {
-            "devices": [d.to_dict() for d in unique_devices.values()],
+    @callback
+    def _build_storage_snapshot(self) -> dict[str, Any]:
+        """Build the data written to persistent storage."""
+        # Each device is stored under exactly one key, its current identifier
+        return {
+            "devices": [d.to_dict() for d in self._devices.values()],
             "last_full_scan": (
                 self._last_full_scan.isoformat() if self._last_full_scan else None
             ),
         }
-        await self._store.async_save(data)
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule a coalesced save to persistent storage if anything changed."""
+        # After shutdown the final state has been flushed; a late delayed write
+        # could overwrite what a reloaded entry has stored since
+        if not self._dirty or self._shut_down:
+            return
+        self._dirty = False
+        self._store.async_delay_save(self._build_storage_snapshot, STORAGE_SAVE_DELAY)
+
+    async def async_flush_devices(self) -> None:
+        """Write device state to persistent storage immediately."""
+        self._dirty = False
+        await self._store.async_save(self._build_storage_snapshot())
+
+    async def async_shutdown(self) -> None:
+        """Cancel pending refreshes, flush devices and release the scanner.
+
+        Home Assistant calls this when the config entry unloads.
+        """
+        self._shut_down = True
+        await super().async_shutdown()
+        self._scanner.close()
+        # Replaces any pending delayed write with the final state
+        await self.async_flush_devices()
 
     def _should_full_scan(self) -> bool:
         """Determine if we should do a full scan."""
@@ -179,28 +281,30 @@ class NetworkMonitorCoordinator(DataUpdateCoordinator[dict[str, DeviceInfo]]):
     async def _async_update_data(self) -> dict[str, DeviceInfo]:
         """Fetch data from network."""
         self._update_count += 1
-        _LOGGER.debug(
-            "Update #%d starting (devices: %d, full_scan: %s)",
-            self._update_count,
-            len(self._devices),
-            self._should_full_scan(),
-        )
-
-        try:
-            if self._should_full_scan():
-                await self._do_full_scan()
-            else:
-                await self._do_quick_check()
-
-            # Save to persistent storage
-            await self._async_save_devices()
-
+        if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(
-                "Update #%d complete (devices: %d, online: %d)",
+                "Update #%d starting (devices: %d, full_scan: %s)",
                 self._update_count,
                 len(self._devices),
-                len(self.online_devices),
+                self._should_full_scan(),
             )
+
+        try:
+            if self._should_full_scan():
+                await self._do_full_scan()
+            elif await self._do_quick_check():
+                self._dirty = True
+
+            # Save to persistent storage (skipped if nothing changed)
+            self._async_schedule_save()
+
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Update #%d complete (devices: %d, online: %d)",
+                    self._update_count,
+                    len(self._devices),
+                    self.online_count,
+                )
             return self._devices
         except Exception as err:
             _LOGGER.error("Update #%d failed: %s", self._update_count, err, exc_info=True)
@@ -211,36 +315,40 @@ class NetworkMonitorCoordinator(DataUpdateCoordinator[dict[str, DeviceInfo]]):
         _LOGGER.info("Performing full network scan")
         self._last_full_scan = datetime.now(timezone.utc)
         self._needs_initial_scan = False
+        self._dirty = True
+        self._scan_gen += 1
+        gen = self._scan_gen
 
         discovered = await self._scanner.full_scan()
 
-        # Track which devices were found in this scan
-        found_identifiers: set[str] = set()
+        devices = self._devices
+        online_ids = self._online_ids
         devices_needing_hostname: list[DeviceInfo] = []
 
         for device in discovered:
             identifier = device.identifier
-            found_identifiers.add(identifier)
 
             # Check if we have an existing device - by MAC, or by IP if no MAC match
-            existing = self._devices.get(identifier)
-            if not existing and device.mac_address:
+            existing = devices.get(identifier)
+            if existing is None and (mac := device.mac_address):
                 # Check if we have this device stored by IP (before MAC was known)
-                ip_entry = self._devices.get(device.ip_address)
-                if ip_entry and ip_entry.mac_address is None:
+                ip_entry = devices.get(device.ip_address)
+                if ip_entry is not None and ip_entry.mac_address is None:
                     existing = ip_entry
                     _LOGGER.info(
                         "Device %s now has MAC address: %s",
                         device.ip_address,
-                        device.mac_address,
+                        mac,
                     )
                     # Remove the stale IP key — device will be re-stored under MAC below
-                    del self._devices[device.ip_address]
-                    found_identifiers.add(device.ip_address)  # Don't mark old IP as not responding
+                    del devices[device.ip_address]
+                    self._drop_device_key(device.ip_address)
 
-            if existing:
+            if existing is not None:
                 # Track if device was offline before this update
                 was_offline = not existing.is_online
+                existing.last_scan_gen = gen
+                self._unindex_device(existing)
                 # Update existing device
                 existing.ip_address = device.ip_address
                 existing.mac_address = device.mac_address or existing.mac_address
@@ -251,7 +359,12 @@ class NetworkMonitorCoordinator(DataUpdateCoordinator[dict[str, DeviceInfo]]):
                 existing.failed_checks = 0
                 existing.last_latency_ms = device.last_latency_ms
                 # Ensure device is accessible by current identifier (MAC if known)
-                self._devices[existing.identifier] = existing
+                key = existing.identifier
+                if key not in devices:
+                    self._mark_new_device(key)
+                devices[key] = existing
+                online_ids.add(key)
+                self._index_device(existing)
                 # Fire online event if device came back online
                 if was_offline:
                     _LOGGER.info(
@@ -265,7 +378,11 @@ class NetworkMonitorCoordinator(DataUpdateCoordinator[dict[str, DeviceInfo]]):
                     devices_needing_hostname.append(existing)
             else:
                 # New device
-                self._devices[identifier] = device
+                device.last_scan_gen = gen
+                devices[identifier] = device
+                online_ids.add(identifier)
+                self._index_device(device)
+                self._mark_new_device(identifier)
                 _LOGGER.info(
                     "Discovered new device: %s (%s)",
                     device.display_name,
@@ -273,8 +390,8 @@ class NetworkMonitorCoordinator(DataUpdateCoordinator[dict[str, DeviceInfo]]):
                 )
 
         # Update devices not found in scan
-        for identifier, device in self._devices.items():
-            if identifier not in found_identifiers:
+        for device in devices.values():
+            if device.last_scan_gen != gen:
                 self._handle_device_not_responding(device)
 
         # Retry hostname resolution for devices without hostnames
@@ -283,9 +400,11 @@ class NetworkMonitorCoordinator(DataUpdateCoordinator[dict[str, DeviceInfo]]):
                 "Retrying hostname resolution for %d devices",
                 len(devices_needing_hostname),
             )
+            hostnames = await self._scanner.resolve_hostnames(
+                [device.ip_address for device in devices_needing_hostname]
+            )
             for device in devices_needing_hostname:
-                hostname = await self._scanner._resolve_hostname(device.ip_address)
-                if hostname:
+                if hostname := hostnames.get(device.ip_address):
                     device.hostname = hostname
                     _LOGGER.info(
                         "Resolved hostname for %s: %s",
@@ -293,19 +412,23 @@ class NetworkMonitorCoordinator(DataUpdateCoordinator[dict[str, DeviceInfo]]):
                         hostname,
                     )
 
-    async def _do_quick_check(self) -> None:
-        """Perform a quick check of known online devices."""
+    async def _do_quick_check(self) -> bool:
+        """Perform a quick check of known online devices.
+
+        Returns True if any device went offline.
+        """
         # Only check devices that are currently online
         devices_to_check = self.online_devices
         if not devices_to_check:
             _LOGGER.debug("No online devices to check")
-            return
+            return False
 
         _LOGGER.debug("Quick check of %d online devices", len(devices_to_check))
 
         results = await self._scanner.check_devices(devices_to_check)
 
         now = datetime.now(timezone.utc)
+        changed = False
         for device in devices_to_check:
             result = results.get(device.identifier, (False, None))
             is_online, latency = result
@@ -313,17 +436,22 @@ class NetworkMonitorCoordinator(DataUpdateCoordinator[dict[str, DeviceInfo]]):
                 device.last_seen = now
                 device.failed_checks = 0
                 device.last_latency_ms = latency
-            else:
-                self._handle_device_not_responding(device)
+            elif self._handle_device_not_responding(device):
+                changed = True
+        return changed
 
-    def _handle_device_not_responding(self, device: DeviceInfo) -> None:
-        """Handle a device that didn't respond to ping."""
+    def _handle_device_not_responding(self, device: DeviceInfo) -> bool:
+        """Handle a device that didn't respond to ping.
+
+        Returns True if the device just went offline.
+        """
         device.failed_checks += 1
 
         if device.failed_checks >= self._offline_threshold:
             if device.is_online:
                 device.is_online = False
                 device.last_latency_ms = None
+                self._online_ids.discard(device.identifier)
                 _LOGGER.info(
                     "Device went offline: %s (%s)",
                     device.display_name,
@@ -331,6 +459,7 @@ class NetworkMonitorCoordinator(DataUpdateCoordinator[dict[str, DeviceInfo]]):
                 )
                 # Fire offline event
                 self._fire_state_change_event(device, EVENT_DEVICE_OFFLINE)
+                return True
         else:
             _LOGGER.debug(
                 "Device %s not responding (%d/%d)",
@@ -338,6 +467,7 @@ class NetworkMonitorCoordinator(DataUpdateCoordinator[dict[str, DeviceInfo]]):
                 device.failed_checks,
                 self._offline_threshold,
             )
+        return False
 
     @callback
     def async_get_device(self, identifier: str) -> DeviceInfo | None:
@@ -348,7 +478,8 @@ class NetworkMonitorCoordinator(DataUpdateCoordinator[dict[str, DeviceInfo]]):
     def resolve_device_id(self, device_id: str) -> str | None:
         """Resolve a user-provided device_id to a known device key.
 
-        Tries exact match first, then matches by MAC or IP on each device.
+        Tries exact match first, then looks up the MAC and IP indexes, then
+        falls back to matching each device's MAC or IP.
         Accepts formats with or without colons/dots (e.g. aabbccddeeff).
         """
         # Exact match on dict key
@@ -356,15 +487,23 @@ class NetworkMonitorCoordinator(DataUpdateCoordinator[dict[str, DeviceInfo]]):
             return device_id
 
         # Normalize: lowercase, strip colons/dashes/dots
-        normalized = device_id.lower().replace(":", "").replace("-", "").replace(".", "")
+        normalized = device_id.lower().translate(_NORMALIZE)
 
+        if key := (
+            self._mac_index.get(normalized)
+            or self._ip_index.get(normalized)
+            or self._ip_index.get(device_id)
+        ):
+            return key
+
+        # The indexes hold one key per address; when devices share an IP and
+        # the indexed one moved away or was forgotten, fall back to a scan
         for key, device in self._devices.items():
-            if device.mac_address:
-                mac_clean = device.mac_address.lower().replace(":", "").replace("-", "")
-                if normalized == mac_clean:
-                    return key
-            ip_clean = device.ip_address.replace(".", "")
-            if normalized == ip_clean or device_id == device.ip_address:
+            mac = device.mac_address
+            if mac and normalized == mac.lower().translate(_NORMALIZE):
+                return key
+            ip = device.ip_address
+            if device_id == ip or normalized == ip.translate(_NORMALIZE):
                 return key
 
         return None
@@ -373,6 +512,8 @@ class NetworkMonitorCoordinator(DataUpdateCoordinator[dict[str, DeviceInfo]]):
         """Remove a device from tracking."""
         if identifier in self._devices:
             device = self._devices.pop(identifier)
+            self._drop_device_key(identifier)
+            self._unindex_device(device)
             _LOGGER.info("Forgot device: %s", device.display_name)
 
             # Remove the HA device registry entry (cascades to entity registry)
@@ -383,7 +524,8 @@ class NetworkMonitorCoordinator(DataUpdateCoordinator[dict[str, DeviceInfo]]):
             if ha_device:
                 device_registry.async_remove_device(ha_device.id)
 
-            await self._async_save_devices()
+            self._dirty = True
+            self._async_schedule_save()
             self.async_set_updated_data(self._devices)
             return True
         return False
@@ -400,12 +542,13 @@ class NetworkMonitorCoordinator(DataUpdateCoordinator[dict[str, DeviceInfo]]):
 
         device.watched = watched
 
-        await self._async_save_devices()
+        self._dirty = True
+        self._async_schedule_save()
         self.async_set_updated_data(self._devices)
         return True
 
     async def async_trigger_full_scan(self) -> None:
         """Trigger an immediate full scan."""
         await self._do_full_scan()
-        await self._async_save_devices()
+        self._async_schedule_save()
         self.async_set_updated_data(self._devices)
@@ -4,26 +4,63 @@ from __future__ import annotations
 
 import asyncio
 import ipaddress
+import json
 import logging
 import re
 import socket
+import struct
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from icmplib import NameLookupError, async_ping
+from icmplib import ICMPLibError, NameLookupError, async_multiping, async_ping
 
 if TYPE_CHECKING:
     from mac_vendor_lookup import AsyncMacLookup
 
 _LOGGER = logging.getLogger(__name__)
 
-# Regex for MAC address validation
-MAC_REGEX = re.compile(r"^([0-9a-fA-F]{2}[:-]){5}([0-9a-fA-F]{2})$")
+# /proc/net/arp rows: IP address, HW type, Flags, HW address, Mask, Device
+_PROC_ARP_REGEX = re.compile(
+    rb"^(\d+\.\d+\.\d+\.\d+)\s+\S+\s+\S+\s+"
+    rb"((?:[0-9a-fA-F]{2}:){5}[0-9a-fA-F]{2})(?=\s)",
+    re.MULTILINE,
+)
+# `arp -an` output: ? (192.168.1.1) at aa:bb:cc:dd:ee:ff [ether] on eth0
+_ARP_CMD_REGEX = re.compile(rb"\((\d+\.\d+\.\d+\.\d+)\) at ([0-9a-fA-F:]+)")
 
+# Reverse DNS / vendor lookups
+HOSTNAME_TIMEOUT = 1.5  # seconds; the system resolver has no timeout of its own
+PTR_CACHE_TTL = 3600  # seconds a resolved hostname is reused
+PTR_NEGATIVE_TTL = 300  # seconds a failed lookup is remembered
+LOOKUP_CACHE_SIZE = 4096
+VENDOR_RETRY_DELAY = 300  # seconds before retrying a failed vendor database load
 
-@dataclass
+_pack_ipv4 = struct.Struct("!I").pack
+
+
+def _cache_put(cache: OrderedDict, key: str, value: object) -> None:
+    """Store a value in an LRU cache, evicting the oldest entry when full."""
+    cache[key] = value
+    cache.move_to_end(key)
+    if len(cache) > LOOKUP_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def _parse_stored_datetime(value: str) -> datetime:
+    """Parse an ISO datetime from storage, assuming UTC if naive."""
+    parsed = datetime.fromisoformat(value)
+    # Ensure timezone awareness for datetimes loaded from old storage
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+@dataclass(slots=True)
 class DeviceInfo:
     """Information about a discovered device."""
 
@@ -37,6 +74,15 @@ class DeviceInfo:
     failed_checks: int = 0
     last_latency_ms: float | None = None
     watched: bool = False
+    # Coordinator full-scan generation this device was last found in
+    last_scan_gen: int = field(default=-1, repr=False, compare=False)
+    # (datetime, isoformat) pairs, recomputed when the datetime is replaced
+    _first_seen_iso: tuple[datetime, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _last_seen_iso: tuple[datetime, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def identifier(self) -> str:
@@ -52,6 +98,28 @@ class DeviceInfo:
             return self.mac_address.replace(":", "").lower()
         return self.ip_address.replace(".", "_")
 
+    @property
+    def first_seen_iso(self) -> str:
+        """Return first_seen as an ISO 8601 string."""
+        cached = self._first_seen_iso
+        if cached is None or cached[0] is not self.first_seen:
+            cached = self._first_seen_iso = (
+                self.first_seen,
+                self.first_seen.isoformat(),
+            )
+        return cached[1]
+
+    @property
+    def last_seen_iso(self) -> str:
+        """Return last_seen as an ISO 8601 string."""
+        cached = self._last_seen_iso
+        if cached is None or cached[0] is not self.last_seen:
+            cached = self._last_seen_iso = (
+                self.last_seen,
+                self.last_seen.isoformat(),
+            )
+        return cached[1]
+
     def to_dict(self) -> dict:
         """Convert to dictionary for storage."""
         return {
@@ -60,8 +128,11 @@ class DeviceInfo:
             "hostname": self.hostname,
             "vendor": self.vendor,
             "is_online": self.is_online,
-            "first_seen": self.first_seen.isoformat(),
-            "last_seen": self.last_seen.isoformat(),
+            # ISO strings are kept so older versions can still load the store
+            "first_seen": self.first_seen_iso,
+            "last_seen": self.last_seen_iso,
+            "first_seen_ts": self.first_seen.timestamp(),
+            "last_seen_ts": self.last_seen.timestamp(),
             "failed_checks": self.failed_checks,
             "last_latency_ms": self.last_latency_ms,
             "watched": self.watched,
@@ -70,13 +141,13 @@ class DeviceInfo:
     @classmethod
     def from_dict(cls, data: dict) -> DeviceInfo:
         """Create from dictionary."""
-        first_seen = datetime.fromisoformat(data["first_seen"])
-        last_seen = datetime.fromisoformat(data["last_seen"])
-        # Ensure timezone awareness for datetimes loaded from old storage
-        if first_seen.tzinfo is None:
-            first_seen = first_seen.replace(tzinfo=timezone.utc)
-        if last_seen.tzinfo is None:
-            last_seen = last_seen.replace(tzinfo=timezone.utc)
+        if "first_seen_ts" in data:
+            first_seen = datetime.fromtimestamp(data["first_seen_ts"], timezone.utc)
+            last_seen = datetime.fromtimestamp(data["last_seen_ts"], timezone.utc)
+        else:
+            # Storage written before timestamps were used holds ISO strings
+            first_seen = _parse_stored_datetime(data["first_seen"])
+            last_seen = _parse_stored_datetime(data["last_seen"])
         return cls(
             ip_address=data["ip_address"],
             mac_address=data.get("mac_address"),
@@ -107,35 +178,86 @@ class NetworkScanner:
         self._ping_count = ping_count
         self._max_concurrent = max_concurrent
         self._mac_lookup: AsyncMacLookup | None = None
+        self._mac_lookup_lock = asyncio.Lock()
+        self._mac_lookup_retry = 0.0  # time.monotonic() of the next load attempt
+        self._privileged: bool | None = None  # ping socket mode, probed once
         self._arp_cache: dict[str, str] = {}
+        # ip -> (hostname, expiry as time.monotonic())
+        self._ptr_cache: OrderedDict[str, tuple[str | None, float]] = OrderedDict()
+        # OUI (first three octets, lowercase) -> vendor
+        self._vendor_cache: OrderedDict[str, str | None] = OrderedDict()
+        # Reverse DNS blocks in the system resolver; keep it off the default pool
+        self._rdns_pool = ThreadPoolExecutor(
+            max_workers=max_concurrent, thread_name_prefix="nwmon-rdns"
+        )
+        self._closed = False
+        # Networks are fixed for the scanner's lifetime; expand them once
+        self._parsed_networks = self._parse_networks(networks)
+        self._expanded_ips = self._expand_networks()
+
+    def close(self) -> None:
+        """Release the reverse DNS worker threads.
+
+        Lookups already queued still finish; new ones resolve to None.
+        """
+        self._closed = True
+        self._rdns_pool.shutdown(wait=False)
 
     async def _get_mac_lookup(self) -> AsyncMacLookup | None:
-        """Get or create MAC lookup instance."""
-        if self._mac_lookup is None:
-            try:
-                from mac_vendor_lookup import AsyncMacLookup
+        """Get or create MAC lookup instance.
 
-                self._mac_lookup = AsyncMacLookup()
-                # Load the database
-                await self._mac_lookup.load_vendors()
-            except Exception as err:
-                _LOGGER.warning("Failed to initialize MAC lookup: %s", err)
+        After a failed load, retries are held off for VENDOR_RETRY_DELAY.
+        """
+        async with self._mac_lookup_lock:
+            if self._mac_lookup is None and time.monotonic() >= self._mac_lookup_retry:
+                try:
+                    from mac_vendor_lookup import AsyncMacLookup
+
+                    lookup = AsyncMacLookup()
+                    # Load the database; only keep the instance once that worked
+                    await lookup.load_vendors()
+                    if not lookup.prefixes:
+                        # A failed download leaves an empty table behind
+                        raise ValueError("vendor database is empty")
+                    self._mac_lookup = lookup
+                except Exception as err:
+                    _LOGGER.warning("Failed to initialize MAC lookup: %s", err)
+                    self._mac_lookup_retry = time.monotonic() + VENDOR_RETRY_DELAY
         return self._mac_lookup
 
-    def _expand_networks(self) -> list[str]:
-        """Expand CIDR networks to list of IP addresses."""
-        ips: list[str] = []
-        for network_str in self._networks:
+    @staticmethod
+    def _parse_networks(
+        networks: list[str],
+    ) -> tuple[ipaddress.IPv4Network | ipaddress.IPv6Network, ...]:
+        """Parse CIDR strings, skipping (and logging) invalid ones."""
+        parsed = []
+        for network_str in networks:
             try:
-                network = ipaddress.ip_network(network_str, strict=False)
-                # Skip network and broadcast addresses for /24 and larger
-                if network.prefixlen <= 30:
-                    ips.extend(str(ip) for ip in network.hosts())
-                else:
-                    ips.extend(str(ip) for ip in network)
+                parsed.append(ipaddress.ip_network(network_str, strict=False))
             except ValueError as err:
                 _LOGGER.error("Invalid network %s: %s", network_str, err)
-        return ips
+        return tuple(parsed)
+
+    def _expand_networks(self) -> tuple[str, ...]:
+        """Expand the parsed networks to IP addresses."""
+        ips: list[str] = []
+        for network in self._parsed_networks:
+            if network.version == 4:
+                # Format from integers rather than building IPv4Address objects
+                first = int(network.network_address)
+                last = int(network.broadcast_address)
+                # Skip network and broadcast addresses for /30 and larger
+                if network.prefixlen <= 30:
+                    first += 1
+                    last -= 1
+                ips.extend(
+                    socket.inet_ntoa(_pack_ipv4(i)) for i in range(first, last + 1)
+                )
+            elif network.prefixlen <= 30:
+                ips.extend(str(ip) for ip in network.hosts())
+            else:
+                ips.extend(str(ip) for ip in network)
+        return tuple(ips)
 
     async def _refresh_arp_cache(self) -> None:
         """Refresh the ARP cache from system."""
@@ -145,19 +267,61 @@ class NetworkScanner:
         arp_path = Path("/proc/net/arp")
         if arp_path.exists():
             try:
-                content = await asyncio.to_thread(arp_path.read_text)
-                for line in content.splitlines()[1:]:  # Skip header
-                    parts = line.split()
-                    if len(parts) >= 4:
-                        ip = parts[0]
-                        mac = parts[3]
-                        if mac != "00:00:00:00:00:00" and MAC_REGEX.match(mac):
-                            self._arp_cache[ip] = mac.lower()
+                content = await asyncio.to_thread(arp_path.read_bytes)
+                self._arp_cache = {
+                    ip.decode(): mac.decode().lower()
+                    for ip, mac in _PROC_ARP_REGEX.findall(content)
+                    if mac != b"00:00:00:00:00:00"
+                }
             except OSError as err:
                 _LOGGER.debug("Failed to read ARP cache: %s", err)
             return
 
-        # Fallback: try arp command
+        # Fallback: ask iproute2, then the arp command
+        neighbors = await self._read_ip_neigh()
+        if neighbors is None:
+            neighbors = await self._read_arp_command()
+        self._arp_cache = neighbors
+
+    async def _read_ip_neigh(self) -> dict[str, str] | None:
+        """Read the neighbor table via `ip -j neigh show`.
+
+        Returns None if iproute2 is unavailable or lacks JSON output.
+        """
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "ip",
+                "-j",
+                "neigh",
+                "show",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            stdout, _ = await proc.communicate()
+        except OSError as err:
+            _LOGGER.debug("Failed to run ip command: %s", err)
+            return None
+        if proc.returncode != 0:
+            return None
+
+        try:
+            entries = json.loads(stdout)
+        except ValueError as err:
+            _LOGGER.debug("Unexpected ip neigh output: %s", err)
+            return None
+
+        # Keep Ethernet-style addresses only (lladdr can be longer on tunnels)
+        return {
+            entry["dst"]: mac.lower()
+            for entry in entries
+            if (mac := entry.get("lladdr"))
+            and len(mac) == 17
+            and mac.count(":") == 5
+            and mac != "00:00:00:00:00:00"
+        }
+
+    async def _read_arp_command(self) -> dict[str, str]:
+        """Read the ARP table via `arp -an`."""
         try:
             proc = await asyncio.create_subprocess_exec(
                 "arp",
@@ -166,22 +330,44 @@ class NetworkScanner:
                 stderr=asyncio.subprocess.DEVNULL,
             )
             stdout, _ = await proc.communicate()
-            for line in stdout.decode().splitlines():
-                # Parse: ? (192.168.1.1) at aa:bb:cc:dd:ee:ff [ether] on eth0
-                match = re.search(
-                    r"\((\d+\.\d+\.\d+\.\d+)\) at ([0-9a-fA-F:]+)", line
-                )
-                if match:
-                    ip, mac = match.groups()
-                    if mac != "00:00:00:00:00:00":
-                        self._arp_cache[ip] = mac.lower()
         except OSError as err:
             _LOGGER.debug("Failed to run arp command: %s", err)
+            return {}
 
-    async def _resolve_hostname(self, ip: str) -> str | None:
-        """Resolve hostname for IP address via reverse DNS lookup."""
+        return {
+            ip.decode(): mac.decode().lower()
+            for ip, mac in _ARP_CMD_REGEX.findall(stdout)
+            if mac != b"00:00:00:00:00:00"
+        }
+
+    async def _resolve_hostname(self, ip: str, refresh: bool = False) -> str | None:
+        """Resolve hostname for IP address via reverse DNS lookup.
+
+        Results are cached; with refresh, cached failures are retried.
+        """
+        cached = self._ptr_cache.get(ip)
+        if cached is not None and cached[1] > time.monotonic():
+            if cached[0] is not None or not refresh:
+                self._ptr_cache.move_to_end(ip)
+                return cached[0]
+
+        hostname = await self._lookup_hostname(ip)
+        ttl = PTR_CACHE_TTL if hostname is not None else PTR_NEGATIVE_TTL
+        _cache_put(self._ptr_cache, ip, (hostname, time.monotonic() + ttl))
+        return hostname
+
+    async def _lookup_hostname(self, ip: str) -> str | None:
+        """Look up the PTR record for an IP address."""
+        if self._closed:
+            # The scanner was closed while a scan was in flight
+            return None
         try:
-            result = await asyncio.to_thread(socket.gethostbyaddr, ip)
+            result = await asyncio.wait_for(
+                asyncio.get_running_loop().run_in_executor(
+                    self._rdns_pool, socket.gethostbyaddr, ip
+                ),
+                HOSTNAME_TIMEOUT,
+            )
             hostname = result[0]
             _LOGGER.debug("Resolved %s -> %s", ip, hostname)
             # Remove domain if present, keep just the hostname
@@ -191,68 +377,125 @@ class NetworkScanner:
                 if not all(p.isdigit() for p in parts):
                     hostname = parts[0]
             return hostname
+        except TimeoutError:
+            _LOGGER.debug("Reverse DNS lookup for %s timed out", ip)
+            return None
         except (socket.herror, socket.gaierror, OSError) as err:
             _LOGGER.debug("Could not resolve hostname for %s: %s", ip, err)
             return None
 
-    async def _resolve_vendor(self, mac: str) -> str | None:
+    async def resolve_hostnames(self, ips: list[str]) -> dict[str, str | None]:
+        """Resolve hostnames for several IP addresses concurrently.
+
+        Returns dict mapping IP address to hostname (None if unresolved).
+        """
+        semaphore = asyncio.Semaphore(self._max_concurrent)
+
+        async def resolve_with_limit(ip: str) -> tuple[str, str | None]:
+            async with semaphore:
+                return ip, await self._resolve_hostname(ip, refresh=True)
+
+        return dict(
+            await asyncio.gather(*[resolve_with_limit(ip) for ip in ips])
+        )
+
+    async def _resolve_vendor(self, mac: str | None) -> str | None:
         """Resolve vendor from MAC address."""
         if not mac:
             return None
 
+        # Vendor only depends on the OUI
+        oui = mac[:8].lower()
+        if oui in self._vendor_cache:
+            self._vendor_cache.move_to_end(oui)
+            return self._vendor_cache[oui]
+
         lookup = await self._get_mac_lookup()
         if not lookup:
             return None
 
-        try:
-            return await lookup.lookup(mac)
-        except Exception:
-            return None
+        # Only a loaded, non-empty database is kept: index its OUI table directly
+        raw = lookup.prefixes.get(oui.replace(":", "").upper().encode())
+        vendor = raw.decode() if raw is not None else None
+        _cache_put(self._vendor_cache, oui, vendor)
+        return vendor
+
+    async def _get_privileged(self) -> bool:
+        """Return whether pings need privileged (raw) sockets.
 
-    async def _ping_host(self, ip: str) -> tuple[bool, float | None]:
+        Probed once with an unprivileged ping to localhost, then reused.
+        """
+        if self._privileged is None:
+            try:
+                await async_ping("127.0.0.1", count=1, timeout=1, privileged=False)
+                self._privileged = False
+            except (ICMPLibError, OSError) as err:
+                _LOGGER.debug("Unprivileged ping unavailable: %s", err)
+                self._privileged = True
+        return self._privileged
+
+    async def _ping_host(self, ip: str, privileged: bool) -> tuple[bool, float | None]:
         """Ping a single host and return (is_alive, latency_ms)."""
         try:
             result = await async_ping(
                 ip,
                 count=self._ping_count,
                 timeout=self._ping_timeout,
-                privileged=False,  # Use unprivileged sockets if available
+                privileged=privileged,
             )
             return (result.is_alive, round(result.avg_rtt, 2) if result.is_alive else None)
         except NameLookupError:
             return (False, None)
-        except OSError as err:
-            # May need privileged mode
-            _LOGGER.debug("Ping failed for %s (may need privileges): %s", ip, err)
-            try:
-                result = await async_ping(
-                    ip,
-                    count=self._ping_count,
-                    timeout=self._ping_timeout,
-                    privileged=True,
-                )
-                return (result.is_alive, round(result.avg_rtt, 2) if result.is_alive else None)
-            except Exception as err2:
-                _LOGGER.debug("Privileged ping also failed for %s: %s", ip, err2)
-                return (False, None)
         except Exception as err:
-            _LOGGER.debug("Unexpected ping error for %s: %s", ip, err)
+            _LOGGER.debug("Ping failed for %s: %s", ip, err)
             return (False, None)
 
-    async def _scan_host(self, ip: str) -> DeviceInfo | None:
-        """Scan a single host and return DeviceInfo if online."""
-        is_online, latency = await self._ping_host(ip)
-        if not is_online:
-            return None
+    async def _ping_all(self, ips: tuple[str, ...]) -> dict[str, float | None]:
+        """Ping all IPs and return latency (ms) for the hosts that replied."""
+        if not ips:
+            return {}
+        privileged = await self._get_privileged()
+        try:
+            hosts = await async_multiping(
+                ips,
+                count=self._ping_count,
+                timeout=self._ping_timeout,
+                concurrent_tasks=self._max_concurrent,
+                privileged=privileged,
+            )
+        except (ICMPLibError, OSError) as err:
+            # Fall back to per-host pings so one failure doesn't lose the scan
+            _LOGGER.debug("Multiping failed, pinging hosts individually: %s", err)
+            semaphore = asyncio.Semaphore(self._max_concurrent)
 
-        # Get MAC from ARP cache
-        mac = self._arp_cache.get(ip)
+            async def ping_with_limit(ip: str) -> tuple[str, bool, float | None]:
+                async with semaphore:
+                    return ip, *await self._ping_host(ip, privileged)
 
-        # Resolve hostname
-        hostname = await self._resolve_hostname(ip)
+            results = await asyncio.gather(*[ping_with_limit(ip) for ip in ips])
+            return {ip: latency for ip, is_alive, latency in results if is_alive}
 
-        # Resolve vendor
-        vendor = await self._resolve_vendor(mac) if mac else None
+        return {
+            host.address: round(host.avg_rtt, 2) for host in hosts if host.is_alive
+        }
+
+    async def _resolve_mac_and_vendor(
+        self, ip: str, arp_refresh: asyncio.Task[None]
+    ) -> tuple[str | None, str | None]:
+        """Wait for the ARP refresh, then return the host's MAC and vendor."""
+        # Shielded: the refresh is shared by every host in the scan
+        await asyncio.shield(arp_refresh)
+        mac = self._arp_cache.get(ip)
+        return mac, await self._resolve_vendor(mac)
+
+    async def _describe_host(
+        self, ip: str, latency: float | None, arp_refresh: asyncio.Task[None]
+    ) -> DeviceInfo:
+        """Build DeviceInfo for a host that responded to ping."""
+        # Reverse DNS doesn't need the MAC, so it runs while ARP is being read
+        hostname, (mac, vendor) = await asyncio.gather(
+            self._resolve_hostname(ip), self._resolve_mac_and_vendor(ip, arp_refresh)
+        )
 
         now = datetime.now(timezone.utc)
         return DeviceInfo(
@@ -271,25 +514,28 @@ class NetworkScanner:
         """Perform a full network scan and return discovered devices."""
         _LOGGER.debug("Starting full network scan of %s", self._networks)
 
-        # Refresh ARP cache before scanning
-        await self._refresh_arp_cache()
-
         # Get all IPs to scan
-        ips = self._expand_networks()
+        ips = self._expanded_ips
         _LOGGER.debug("Scanning %d IP addresses", len(ips))
 
-        # Use semaphore to limit concurrent pings
+        # Ping all IPs, then resolve details for the hosts that replied
+        alive = await self._ping_all(ips)
+
+        # Read ARP once, after pinging, so it includes the hosts that replied
+        arp_refresh = asyncio.create_task(self._refresh_arp_cache())
+
+        # Use semaphore to limit concurrent lookups
         semaphore = asyncio.Semaphore(self._max_concurrent)
 
-        async def scan_with_limit(ip: str) -> DeviceInfo | None:
+        async def describe_with_limit(ip: str, latency: float | None) -> DeviceInfo:
             async with semaphore:
-                return await self._scan_host(ip)
+                return await self._describe_host(ip, latency, arp_refresh)
 
-        # Scan all IPs concurrently
         results = await asyncio.gather(
-            *[scan_with_limit(ip) for ip in ips],
+            *[describe_with_limit(ip, latency) for ip, latency in alive.items()],
             return_exceptions=True,
         )
+        await arp_refresh
 
         # Filter successful results
         devices: list[DeviceInfo] = []
@@ -300,16 +546,6 @@ class NetworkScanner:
                 _LOGGER.debug("Scan error: %s", result)
 
         _LOGGER.info("Full scan complete: found %d online devices", len(devices))
-
-        # Refresh ARP cache again after scanning to pick up new entries
-        await self._refresh_arp_cache()
-
-        # Update MAC addresses for devices that didn't have them
-        for device in devices:
-            if not device.mac_address and device.ip_address in self._arp_cache:
-                device.mac_address = self._arp_cache[device.ip_address]
-                device.vendor = await self._resolve_vendor(device.mac_address)
-
         return devices
 
     async def check_devices(
@@ -324,27 +560,26 @@ class NetworkScanner:
 
         _LOGGER.debug("Quick check of %d devices", len(devices))
 
+        privileged = await self._get_privileged()
         semaphore = asyncio.Semaphore(self._max_concurrent)
 
         async def ping_with_limit(
             device: DeviceInfo,
         ) -> tuple[str, bool, float | None]:
             async with semaphore:
-                is_online, latency = await self._ping_host(device.ip_address)
+                is_online, latency = await self._ping_host(
+                    device.ip_address, privileged
+                )
                 return device.identifier, is_online, latency
 
-        results = await asyncio.gather(
-            *[ping_with_limit(d) for d in devices],
-            return_exceptions=True,
-        )
+        # _ping_host never raises, so no return_exceptions filtering is needed
+        results = await asyncio.gather(*[ping_with_limit(d) for d in devices])
 
         status: dict[str, tuple[bool, float | None]] = {}
-        for result in results:
-            if isinstance(result, tuple):
-                identifier, is_online, latency = result
-                status[identifier] = (is_online, latency)
-
-        online_count = sum(1 for alive, _ in status.values() if alive)
+        online_count = 0
+        for identifier, is_online, latency in results:
+            status[identifier] = (is_online, latency)
+            online_count += is_online
         _LOGGER.debug("Quick check complete: %d/%d online", online_count, len(devices))
 
         return status
@@ -12,10 +12,11 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import DOMAIN, NEW_DEVICE_COOLDOWN
 from .coordinator import NetworkMonitorCoordinator
 from .scanner import DeviceInfo
 
@@ -45,30 +46,49 @@ async def async_setup_entry(
     )
 
     # Dynamic per-device latency sensors
-    known_latency_entities: set[str] = set()
+    known_latency_entities: set[str] = set(coordinator.devices)
+    pending = coordinator.async_track_new_devices()
 
     @callback
     def async_add_latency_sensors() -> None:
         """Add latency sensor entities for newly discovered devices."""
         new_entities: list[DeviceLatencySensor] = []
 
-        for device in coordinator.devices.values():
-            if device.identifier not in known_latency_entities:
-                known_latency_entities.add(device.identifier)
-                new_entities.append(
-                    DeviceLatencySensor(coordinator, entry.entry_id, device)
-                )
+        while pending:
+            identifier = pending.pop()
+            if identifier in known_latency_entities:
+                continue
+            if (device := coordinator.async_get_device(identifier)) is None:
+                continue
+            known_latency_entities.add(identifier)
+            new_entities.append(
+                DeviceLatencySensor(coordinator, entry.entry_id, device)
+            )
 
         if new_entities:
             _LOGGER.info("Adding %d new latency sensor entities", len(new_entities))
             async_add_entities(new_entities)
 
     # Add initial latency sensors
-    async_add_latency_sensors()
+    if coordinator.devices:
+        async_add_entities(
+            [
+                DeviceLatencySensor(coordinator, entry.entry_id, device)
+                for device in coordinator.devices.values()
+            ]
+        )
 
     # Listen for coordinator updates to add latency sensors for new devices
+    add_debouncer = Debouncer(
+        hass,
+        _LOGGER,
+        cooldown=NEW_DEVICE_COOLDOWN,
+        immediate=True,
+        function=async_add_latency_sensors,
+    )
+    entry.async_on_unload(add_debouncer.async_shutdown)
     entry.async_on_unload(
-        coordinator.async_add_listener(async_add_latency_sensors)
+        coordinator.async_add_listener(add_debouncer.async_schedule_call)
     )
 
 
@@ -110,7 +130,7 @@ class DevicesOnlineSensor(NetworkMonitorSensor):
     @property
     def native_value(self) -> int:
         """Return the number of online devices."""
-        return len(self.coordinator.online_devices)
+        return self.coordinator.online_count
 
 
 class DevicesTotalSensor(NetworkMonitorSensor):
@@ -0,0 +1 @@
+"""Tests for the Network Monitor integration."""
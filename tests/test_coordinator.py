@@ -0,0 +1,48 @@
+"""Tests for the network monitor coordinator."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from custom_components.nwmon.coordinator import NetworkMonitorCoordinator
+from custom_components.nwmon.scanner import DeviceInfo
+
+
+def _make_coordinator_stub(*devices: DeviceInfo) -> SimpleNamespace:
+    """Build a stub with the state used by the device index helpers."""
+    coord = SimpleNamespace(_devices={}, _mac_index={}, _ip_index={})
+    for device in devices:
+        coord._devices[device.identifier] = device
+        NetworkMonitorCoordinator._index_device(coord, device)
+    return coord
+
+
+def test_resolve_shared_ip_after_indexed_device_moves() -> None:
+    """A device sharing an IP stays resolvable when the indexed one moves."""
+    stale = DeviceInfo(ip_address="192.168.1.50", mac_address="aa:bb:cc:00:00:01")
+    new = DeviceInfo(ip_address="192.168.1.50", mac_address="aa:bb:cc:00:00:02")
+    coord = _make_coordinator_stub(stale, new)
+
+    # The index entry for the shared IP belongs to the later device; move it
+    NetworkMonitorCoordinator._unindex_device(coord, new)
+    new.ip_address = "192.168.1.51"
+    NetworkMonitorCoordinator._index_device(coord, new)
+
+    resolve = NetworkMonitorCoordinator.resolve_device_id
+    assert resolve(coord, "192.168.1.50") == stale.identifier
+    assert resolve(coord, "192168150") == stale.identifier
+    assert resolve(coord, "192.168.1.51") == new.identifier
+
+
+def test_resolve_shared_ip_after_indexed_device_forgotten() -> None:
+    """A device sharing an IP stays resolvable when the indexed one is removed."""
+    stale = DeviceInfo(ip_address="192.168.1.50", mac_address="aa:bb:cc:00:00:01")
+    new = DeviceInfo(ip_address="192.168.1.50", mac_address="aa:bb:cc:00:00:02")
+    coord = _make_coordinator_stub(stale, new)
+
+    del coord._devices[new.identifier]
+    NetworkMonitorCoordinator._unindex_device(coord, new)
+
+    resolve = NetworkMonitorCoordinator.resolve_device_id
+    assert resolve(coord, "192.168.1.50") == stale.identifier
+    assert resolve(coord, "AA-BB-CC-00-00-02") is None
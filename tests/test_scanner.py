@@ -0,0 +1,93 @@
+"""Tests for the network scanner."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+import socket
+import threading
+
+import mac_vendor_lookup
+import pytest
+
+from custom_components.nwmon.scanner import DeviceInfo, NetworkScanner
+
+
+def test_close_with_queued_lookup(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Lookups queued when the scanner closes resolve instead of raising."""
+    release = threading.Event()
+
+    def slow_gethostbyaddr(ip: str) -> tuple[str, list[str], list[str]]:
+        release.wait(5)
+        return (f"host-{ip.rsplit('.', 1)[1]}.lan", [], [ip])
+
+    monkeypatch.setattr(socket, "gethostbyaddr", slow_gethostbyaddr)
+
+    async def run() -> tuple[str | None, str | None]:
+        scanner = NetworkScanner(["192.0.2.0/30"], max_concurrent=1)
+        # One worker: the first lookup runs, the second waits in the queue
+        running = asyncio.ensure_future(scanner._lookup_hostname("192.0.2.1"))
+        queued = asyncio.ensure_future(scanner._lookup_hostname("192.0.2.2"))
+        await asyncio.sleep(0.05)
+        scanner.close()
+        release.set()
+        return await running, await queued
+
+    assert asyncio.run(run()) == ("host-1", "host-2")
+
+
+def test_lookup_after_close(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Lookups started after close resolve to None."""
+    monkeypatch.setattr(
+        socket, "gethostbyaddr", lambda ip: pytest.fail("lookup after close")
+    )
+    scanner = NetworkScanner(["192.0.2.0/30"])
+    scanner.close()
+
+    assert asyncio.run(scanner.resolve_hostnames(["192.0.2.1"])) == {
+        "192.0.2.1": None
+    }
+
+
+def test_empty_vendor_database_is_retried(monkeypatch: pytest.MonkeyPatch) -> None:
+    """An empty prefix table counts as a failed load and caches nothing."""
+    tables = [{}, {b"AABBCC": b"Acme"}]
+    loads = []
+
+    class FakeMacLookup:
+        def __init__(self) -> None:
+            self.prefixes = None
+
+        async def load_vendors(self) -> None:
+            loads.append(None)
+            self.prefixes = tables[len(loads) - 1]
+
+    monkeypatch.setattr(mac_vendor_lookup, "AsyncMacLookup", FakeMacLookup)
+
+    async def run() -> tuple[str | None, str | None, str | None]:
+        scanner = NetworkScanner(["192.0.2.0/30"])
+        first = await scanner._resolve_vendor("aa:bb:cc:00:00:01")
+        # Within the retry delay the database is not loaded again
+        second = await scanner._resolve_vendor("aa:bb:cc:00:00:01")
+        assert scanner._vendor_cache == {}
+        scanner._mac_lookup_retry = 0.0
+        third = await scanner._resolve_vendor("aa:bb:cc:00:00:01")
+        scanner.close()
+        return first, second, third
+
+    assert asyncio.run(run()) == (None, None, "Acme")
+    assert len(loads) == 2
+
+
+def test_stored_device_round_trip() -> None:
+    """Stored devices load from timestamps and keep ISO fields for downgrades."""
+    device = DeviceInfo(ip_address="192.0.2.1", mac_address="aa:bb:cc:00:00:01")
+    data = device.to_dict()
+
+    assert datetime.fromisoformat(data["first_seen"]) == device.first_seen
+    assert datetime.fromisoformat(data["last_seen"]) == device.last_seen
+    assert DeviceInfo.from_dict(data) == device
+
+    # Storage written before timestamps were added
+    del data["first_seen_ts"], data["last_seen_ts"]
+    assert DeviceInfo.from_dict(data) == device